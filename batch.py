@@ -0,0 +1,68 @@
+import time
+from typing import Dict, Any, Optional, Tuple
+
+import orjson
+from rich.console import Console
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+FINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+BATCH_MAX_RETRIES = 2
+
+
+def run_chat_batch(client, requests: Dict[str, Dict[str, Any]], console: Console,
+                   poll_interval: float = 30) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+    """Submit chat completion bodies through the OpenAI Batch API and wait for the results.
+
+    ``requests`` maps a custom id to a chat completion request body. The returned dict maps
+    each custom id to ``(content, finish_reason)``, or ``(None, None)`` if that request failed.
+    """
+    # The shared clients leave retrying to llm_client; a long poll loop should not die on one blip
+    client = client.with_options(max_retries=BATCH_MAX_RETRIES)
+
+    batch_input = b"".join(
+        orjson.dumps({"custom_id": custom_id, "method": "POST", "url": BATCH_ENDPOINT, "body": body}) + b"\n"
+        for custom_id, body in requests.items()
+    )
+
+    input_file = client.files.create(file=("batch_requests.jsonl", batch_input), purpose="batch")
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint=BATCH_ENDPOINT,
+        completion_window="24h"
+    )
+    console.print(f"[cyan]📦 Submitted batch {batch.id} with {len(requests)} request(s)[/cyan]")
+
+    # Poll quickly at first for small batches, backing off to poll_interval between checks
+    delay = 1.0
+    with console.status(f"[yellow]⏳ Batch status: {batch.status}[/yellow]") as status:
+        while batch.status not in FINAL_STATUSES:
+            time.sleep(delay)
+            delay = min(delay * 2, poll_interval)
+            batch = client.batches.retrieve(batch.id)
+            counts = batch.request_counts
+            progress = f" ({counts.completed}/{counts.total} done)" if counts else ""
+            status.update(f"[yellow]⏳ Batch status: {batch.status}{progress}[/yellow]")
+
+    results: Dict[str, Tuple[Optional[str], Optional[str]]] = {custom_id: (None, None) for custom_id in requests}
+
+    if batch.status != "completed":
+        console.print(f"[red]Batch {batch.id} finished with status: {batch.status}[/red]")
+        return results
+
+    if not batch.output_file_id:
+        return results
+
+    output = client.files.content(batch.output_file_id).text
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        record = orjson.loads(line)
+        response = record.get("response") or {}
+        if response.get("status_code") != 200:
+            continue
+        choices = response.get("body", {}).get("choices") or []
+        if choices:
+            # Batch answers get no continuation, so callers need finish_reason to spot cut-off ones
+            results[record["custom_id"]] = (choices[0]["message"]["content"], choices[0].get("finish_reason"))
+
+    return results
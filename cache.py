@@ -0,0 +1,152 @@
+import os
+import time
+import hashlib
+import tempfile
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Tuple
+
+import numpy as np
+import orjson
+
+
+class ResponseCache:
+    """On-disk cache of generated documents keyed by a hash of the request.
+
+    Entries older than ``ttl`` seconds are treated as missing; ``None`` keeps them forever.
+    """
+
+    def __init__(self, root: Path, ttl: Optional[float] = None):
+        self.root = Path(root)
+        self.ttl = ttl
+
+    @staticmethod
+    def make_key(payload: Dict[str, Any]) -> str:
+        return hashlib.blake2b(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / key
+
+    def get(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            if self.ttl is not None and time.time() - path.stat().st_mtime > self.ttl:
+                return None
+            return path.read_text(encoding="utf-8")
+        except (FileNotFoundError, IOError):
+            return None
+
+    def set(self, key: str, content: str):
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file first so readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        except IOError:
+            return
+
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except IOError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+class SemanticCache:
+    """Embedding index that maps near-duplicate topics onto cached responses."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._emb = None
+        self._keys: List[str] = []
+        self._scopes: List[str] = []
+        self.load()
+
+    def load(self):
+        self._emb = None
+        self._keys = []
+        self._scopes = []
+        if not self.path.exists():
+            return
+        try:
+            with np.load(self.path) as data:
+                self._emb = data["embeddings"].astype(np.float32)
+                self._keys = data["keys"].tolist()
+                self._scopes = data["scopes"].tolist()
+        except (IOError, KeyError, ValueError):
+            self._emb = None
+            self._keys = []
+            self._scopes = []
+
+    def save(self):
+        if self._emb is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        except IOError:
+            return
+
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f, embeddings=self._emb, keys=np.array(self._keys),
+                         scopes=np.array(self._scopes))
+            os.replace(tmp_path, self.path)
+        except IOError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def scope(**settings) -> str:
+        """Key for the settings besides the topic; only entries with an identical scope may match."""
+        return ResponseCache.make_key(settings)
+
+    @staticmethod
+    def _normalize(embedding) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def lookup(self, embedding, scope: str) -> Tuple[Optional[str], float]:
+        """Return the best matching cache key within ``scope`` and its cosine similarity."""
+        if self._emb is None or not self._keys:
+            return None, 0.0
+
+        query = self._normalize(embedding)
+        if query.shape[0] != self._emb.shape[1]:
+            return None, 0.0
+
+        scores = self._emb @ query
+        in_scope = np.array([s == scope for s in self._scopes])
+        scores = np.where(in_scope, scores, -1.0)
+
+        best = int(np.argmax(scores))
+        if not in_scope[best]:
+            return None, 0.0
+        return self._keys[best], float(scores[best])
+
+    def find_cached(self, embedding, scope: str, cache: ResponseCache) -> Tuple[Optional[str], float]:
+        """Return the cached content of the best match within ``scope`` and its similarity."""
+        match_key, score = self.lookup(embedding, scope)
+        cached = cache.get(match_key) if match_key else None
+        return cached, score
+
+    def add(self, embedding, key: str, scope: str):
+        vector = self._normalize(embedding)[np.newaxis, :]
+        if self._emb is None:
+            self._emb = vector
+        elif self._emb.shape[1] != vector.shape[1]:
+            # Embedding model changed; start a fresh index
+            self._emb = vector
+            self._keys = []
+            self._scopes = []
+        else:
+            self._emb = np.vstack([self._emb, vector])
+        self._keys.append(key)
+        self._scopes.append(scope)
+        self.save()
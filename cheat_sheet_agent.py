@@ -1,136 +1,37 @@
-import os
-import json
-from datetime import datetime
-from typing import Optional, Dict, Any
+import asyncio
+import string
+import time
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple
 from pathlib import Path
 
-import openai
-from dotenv import load_dotenv
+import httpx
 from pydantic import BaseModel, Field
 from rich.console import Console
 from rich.markdown import Markdown
 from rich.panel import Panel
-from config import Config
+from config import Config, slugify
+from cache import ResponseCache, SemanticCache
+from batch import run_chat_batch
+from rate_limit import TokenBucket
+from tokens import count_tokens, count_message_tokens, budget_max_tokens
+from llm_client import (STALLED, TRUNCATED_FINISH_REASONS, LazyAsyncClient, acall_with_retries,
+                        aembed_text, embed_text, get_openai_client, stream_completion)
 
-load_dotenv()
+SYSTEM_PROMPT = "You are an expert technical writer and educator who creates comprehensive, well-structured cheat sheets for various technologies. Your cheat sheets are accurate, practical, and beautifully formatted in Markdown."
 
-class CheatSheetConfig(BaseModel):
-    topic: str = Field(..., description="The technology or topic for the cheat sheet")
-    difficulty_level: str = Field(default="intermediate", description="beginner, intermediate, or advanced")
-    sections: Optional[list] = Field(default=None, description="Specific sections to include")
-    format_style: str = Field(default="comprehensive", description="quick-reference or comprehensive")
-    include_examples: bool = Field(default=True, description="Include code examples")
-
-class CheatSheetAgent:
-    def __init__(self):
-        self.config = Config()
-        api_key = self.config.get_api_key()
-        
-        if not api_key:
-            raise ValueError("OpenAI API key not found. Please set OPENAI_API_KEY in .env file or config.")
-        
-        self.client = openai.OpenAI(api_key=api_key)
-        self.console = Console()
-        
-        output_dir_name = self.config.get("output_directory", "cheat_sheets")
-        self.output_dir = Path(output_dir_name)
-        self.output_dir.mkdir(exist_ok=True)
-        
-    def generate_cheat_sheet(self, config: CheatSheetConfig) -> str:
-        prompt = self._create_prompt(config)
-        
-        try:
-            response = self.client.chat.completions.create(
-                model=self.config.get("model", "gpt-4"),
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert technical writer and educator who creates comprehensive, well-structured cheat sheets for various technologies. Your cheat sheets are accurate, practical, and beautifully formatted in Markdown."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=self.config.get("temperature", 0.7),
-                max_tokens=self.config.get("max_tokens", 16000)
-            )
-            
-            content = response.choices[0].message.content
-            
-            # Check if content is too short and retry with more explicit instructions
-            if len(content) < 5000:
-                self.console.print("[yellow]⚠️ Content seems short, requesting more comprehensive version...[/yellow]")
-                
-                enhanced_prompt = f"""
-The previous response was too brief. Please create a MUCH MORE COMPREHENSIVE cheat sheet for {config.topic}.
-
-REQUIREMENTS:
-- Write EVERYTHING in ENGLISH language only
-- Minimum 8000+ words
-- Include at least 75 code examples
-- Cover ALL major aspects in detail
-- Add extensive explanations for each concept
-- Include multiple approaches for each task
-- Add real-world scenarios and use cases
-- For libraries: Include TOP 50+ most used methods with complete documentation
-
-{prompt}
+ADAPT_SYSTEM_PROMPT = "Adapt the following cheat sheet to the new topic, preserving identical sections. Rewrite only what differs for the new topic and return the complete adapted cheat sheet in the same Markdown format."
 
-IMPORTANT: Make this substantially longer and more detailed than a typical cheat sheet. This should be a complete learning resource.
-"""
-                
-                response = self.client.chat.completions.create(
-                    model=self.config.get("model", "gpt-4o"),
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are an expert technical writer who creates extremely comprehensive, detailed reference documents. Never provide brief or summary content - always create extensive, complete guides."
-                        },
-                        {
-                            "role": "user",
-                            "content": enhanced_prompt
-                        }
-                    ],
-                    temperature=self.config.get("temperature", 0.7),
-                    max_tokens=self.config.get("max_tokens", 16000)
-                )
-                content = response.choices[0].message.content
-            
-            return content
-            
-        except Exception as e:
-            self.console.print(f"[red]Error generating cheat sheet: {str(e)}[/red]")
-            return None
-    
-    def _create_prompt(self, config: CheatSheetConfig) -> str:
-        base_prompt = f"""
-Create an EXTREMELY COMPREHENSIVE and DETAILED cheat sheet for {config.topic} targeted at {config.difficulty_level} level users.
+# Responses shorter than this are extended with a follow-up request
+MIN_CONTENT_CHARS = 5000
 
-CRITICAL REQUIREMENTS:
-- Write EVERYTHING in ENGLISH language only
-- This must be a COMPLETE, PROFESSIONAL-GRADE reference document
-- Format: Rich, well-structured Markdown with extensive content
-- Style: {config.format_style} - but always err on the side of MORE content
-- Include examples: {config.include_examples} - provide MULTIPLE examples for each concept
-- Use proper Markdown syntax with headers, code blocks, tables, and lists
-- Add emojis for visual appeal and better organization
-- Include a detailed table of contents with clickable links
-- Organize content logically with MANY clear sections and subsections
-- Minimum 75+ code examples across different use cases
-- Include edge cases, advanced techniques, and real-world scenarios
-- For libraries: Focus extensively on the MOST COMMONLY USED and PRACTICAL methods/functions
-- For libraries: Include comprehensive method reference with parameters, return values, and examples
+CONTINUE_PROMPT = "Your cheat sheet is incomplete. Continue from where you stopped, adding the missing sections from the mandatory structure in the same format and level of detail. Do not repeat any content you already wrote."
 
-"""
-        
-        if config.sections:
-            base_prompt += f"Focus extensively on these sections with deep detail: {', '.join(config.sections)}\n"
-        
-        structure_guide = f"""
+_STRUCTURE_GUIDE_TMPL = string.Template("""
 MANDATORY STRUCTURE - Each section must be COMPREHENSIVE:
 
-# 🔥 {config.topic} - Complete Reference Guide
+# 🔥 $topic - Complete Reference Guide
 
 ## 📑 Table of Contents
 (Detailed TOC with all sections and subsections)
@@ -268,18 +169,329 @@ The cheat sheet should be so comprehensive that someone could learn the technolo
 
 MINIMUM LENGTH: This should be a substantial document with 150+ distinct pieces of information, examples, and explanations.
 TARGET: 8000+ words for truly comprehensive coverage.
+""")
+
+class CheatSheetConfig(BaseModel):
+    topic: str = Field(..., description="The technology or topic for the cheat sheet")
+    difficulty_level: str = Field(default="intermediate", description="beginner, intermediate, or advanced")
+    sections: Optional[list] = Field(default=None, description="Specific sections to include")
+    format_style: str = Field(default="comprehensive", description="quick-reference or comprehensive")
+    include_examples: bool = Field(default=True, description="Include code examples")
+
+class CheatSheetAgent:
+    def __init__(self, async_http_client: Optional[httpx.AsyncClient] = None):
+        self.config = Config()
+        api_key = self.config.get_api_key()
+        
+        if not api_key:
+            raise ValueError("OpenAI API key not found. Please set OPENAI_API_KEY in .env file or config.")
+        
+        self.api_key = api_key
+        self.client = get_openai_client(api_key)
+        self._aclient = LazyAsyncClient(api_key, async_http_client)
+        self._compressor = None
+        self._compression_available = True
+        self.console = Console()
+        
+        output_dir_name = self.config.get("output_directory", "cheat_sheets")
+        self.output_dir = Path(output_dir_name)
+        self.output_dir.mkdir(exist_ok=True)
+        
+        self.cache = ResponseCache(self.output_dir / ".cache")
+        self.semantic_cache = SemanticCache(self.output_dir / ".sem_cache.npz")
+        
+    def generate_cheat_sheet(self, config: CheatSheetConfig, use_cache: bool = True) -> str:
+        request = self._build_request(config)
+        cache_key = self._cache_key(request)
+        
+        embedding = None
+        semantic_scope = self._semantic_scope(config, request["model"])
+        
+        if use_cache:
+            cached, embedding = self._lookup_cached(config, request, cache_key, semantic_scope)
+            if cached:
+                return cached
+        
+        try:
+            sent_request = self._compress_request(request)
+            content, finish_reason = stream_completion(
+                self.client,
+                self.console,
+                stall_timeout=self.config.get("stream_stall_timeout", 30),
+                **sent_request
+            )
+            
+            if finish_reason == STALLED and not content:
+                self.console.print("[yellow]⚠️ Response stalled, restarting the request...[/yellow]")
+                content, finish_reason = stream_completion(self.client, self.console, **sent_request)
+            
+            # Long, finished answers skip the follow-up entirely; short or cut-off ones are extended, not regenerated
+            continuation_request = self._continuation_request(sent_request, content, finish_reason)
+            if continuation_request:
+                self.console.print("[yellow]⚠️ Content seems short, requesting the missing sections...[/yellow]")
+                
+                continuation, _ = stream_completion(self.client, self.console, **continuation_request)
+                content = content + "\n" + continuation
+            
+            if content:
+                self._store_cached(content, cache_key, embedding, semantic_scope)
+            
+            return content
+            
+        except Exception as e:
+            self.console.print(f"[red]Error generating cheat sheet: {str(e)}[/red]")
+            return None
+    
+    def _lookup_cached(self, config: CheatSheetConfig, request: Dict[str, Any], cache_key: str,
+                       semantic_scope: str) -> Tuple[Optional[str], Optional[list]]:
+        """Return a cached, or adapted, cheat sheet for this request if there is one, and the topic embedding."""
+        cached = self.cache.get(cache_key)
+        if cached:
+            self.console.print(f"[green]⚡ Loaded cheat sheet for {config.topic} from cache[/green]")
+            return cached, None
+        
+        embedding = embed_text(self.client, self.config.get("embedding_model", "text-embedding-3-small"), config.topic)
+        if embedding is None:
+            return None, None
+        
+        cached, score = self.semantic_cache.find_cached(embedding, semantic_scope, self.cache)
+        
+        if cached and score >= self.config.get("semantic_cache_threshold", 0.93):
+            self.console.print(f"[green]⚡ Loaded cheat sheet for a similar topic from cache (similarity {score:.2f})[/green]")
+            return cached, embedding
+        
+        if cached and score >= self.config.get("adapt_cache_threshold", 0.80):
+            adapted = self._adapt_cheat_sheet(cached, config, request["model"], request["temperature"])
+            if adapted:
+                self._store_cached(adapted, cache_key, embedding, semantic_scope)
+                return adapted, embedding
+        
+        return None, embedding
+    
+    def _store_cached(self, content: str, cache_key: str, embedding: Optional[list], semantic_scope: str):
+        self.cache.set(cache_key, content)
+        if embedding is not None:
+            self.semantic_cache.add(embedding, cache_key, semantic_scope)
+    
+    def _adapt_cheat_sheet(self, cached: str, config: CheatSheetConfig, model: str,
+                           temperature: float) -> Optional[str]:
+        """Rewrite a cached cheat sheet for a closely related topic instead of starting from scratch."""
+        self.console.print(f"[cyan]♻️ Adapting a cached cheat sheet for a related topic to: {config.topic}[/cyan]")
+        
+        try:
+            content, _ = stream_completion(
+                self.client,
+                self.console,
+                **self._adapt_request(cached, config, model, temperature)
+            )
+        except Exception as e:
+            self.console.print(f"[yellow]⚠️ Could not adapt cached cheat sheet, generating from scratch: {str(e)}[/yellow]")
+            return None
+        
+        return content or None
+    
+    async def _aadapt_cheat_sheet(self, cached: str, config: CheatSheetConfig, model: str,
+                                  temperature: float, bucket: TokenBucket) -> Optional[str]:
+        """Async counterpart of _adapt_cheat_sheet."""
+        self.console.print(f"[cyan]♻️ Adapting a cached cheat sheet for a related topic to: {config.topic}[/cyan]")
+        
+        try:
+            content, _ = await self._acomplete(self._adapt_request(cached, config, model, temperature), bucket)
+        except Exception as e:
+            self.console.print(f"[yellow]⚠️ Could not adapt cached cheat sheet, generating from scratch: {str(e)}[/yellow]")
+            return None
+        
+        return content or None
+    
+    def _adapt_request(self, cached: str, config: CheatSheetConfig, model: str,
+                       temperature: float) -> Dict[str, Any]:
+        messages = [
+            {
+                "role": "system",
+                "content": ADAPT_SYSTEM_PROMPT
+            },
+            {
+                "role": "assistant",
+                "content": cached
+            },
+            {
+                "role": "user",
+                "content": f"Adapt the cheat sheet above to the new topic: {config.topic} "
+                           f"({config.difficulty_level} level, {config.format_style} style)."
+            }
+        ]
+        return {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": budget_max_tokens(messages, model, self.config.get("adapt_max_tokens", 6000))
+        }
+    
+    def _continuation_request(self, request: Dict[str, Any], content: str,
+                              finish_reason: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Build the follow-up request that extends a short or cut-off answer, or None if it is complete."""
+        if len(content) >= MIN_CONTENT_CHARS and finish_reason not in TRUNCATED_FINISH_REASONS:
+            return None
+        
+        model = request["model"]
+        remaining_tokens = request["max_tokens"] - count_tokens(content, model)
+        if remaining_tokens <= 0:
+            return None
+        
+        messages = request["messages"] + [
+            {
+                "role": "assistant",
+                "content": content
+            },
+            {
+                "role": "user",
+                "content": CONTINUE_PROMPT
+            }
+        ]
+        return {**request, "messages": messages, "max_tokens": budget_max_tokens(messages, model, remaining_tokens)}
+    
+    def _build_request(self, config: CheatSheetConfig) -> Dict[str, Any]:
+        model = self.config.get("model", "gpt-4")
+        messages = [
+            {
+                "role": "system",
+                "content": SYSTEM_PROMPT
+            },
+            {
+                "role": "user",
+                "content": self._create_prompt(config)
+            }
+        ]
+        return {
+            "model": model,
+            "messages": messages,
+            "temperature": self.config.get("temperature", 0.7),
+            "max_tokens": budget_max_tokens(messages, model, self.config.get("max_tokens", 16000))
+        }
+    
+    def _is_complete(self, finish_reason: Optional[str]) -> bool:
+        # Batch answers are not continued; a cut-off one is still saved but not cached
+        if finish_reason in TRUNCATED_FINISH_REASONS:
+            self.console.print("[yellow]⚠️ Cheat sheet was cut off, not caching it[/yellow]")
+            return False
+        return True
+    
+    def prepare_batch_request(self, config: CheatSheetConfig,
+                              use_cache: bool = True) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """Return ``(cached, None)`` on a cache hit, else ``(None, pending)`` for a batch job.
+
+        ``pending["body"]`` is the chat completion body for run_chat_batch; pass ``pending`` and the
+        batch result to store_batch_result.
+        """
+        request = self._build_request(config)
+        cache_key = self._cache_key(request)
+        
+        embedding = None
+        semantic_scope = self._semantic_scope(config, request["model"])
+        
+        if use_cache:
+            cached, embedding = self._lookup_cached(config, request, cache_key, semantic_scope)
+            if cached:
+                return cached, None
+        
+        return None, {
+            "body": self._compress_request(request),
+            "cache_key": cache_key,
+            "embedding": embedding,
+            "semantic_scope": semantic_scope
+        }
+    
+    def store_batch_result(self, pending: Dict[str, Any], content: str, finish_reason: Optional[str]):
+        """Cache a cheat sheet produced for a request from prepare_batch_request, unless it was cut off."""
+        if content and self._is_complete(finish_reason):
+            self._store_cached(content, pending["cache_key"], pending["embedding"], pending["semantic_scope"])
+    
+    def _cache_key(self, request: Dict[str, Any]) -> str:
+        return ResponseCache.make_key({
+            "model": request["model"],
+            "system_prompt": request["messages"][0]["content"],
+            "user_prompt": request["messages"][1]["content"],
+            "temperature": request["temperature"],
+            "max_tokens": request["max_tokens"]
+        })
+    
+    def _get_compressor(self):
+        if self._compressor is None and self._compression_available:
+            try:
+                from llmlingua import PromptCompressor
+            except ImportError:
+                self.console.print("[yellow]⚠️ llmlingua is not installed, sending prompts uncompressed (pip install llmlingua)[/yellow]")
+                self._compression_available = False
+                return None
+            
+            self._compressor = PromptCompressor(
+                model_name=self.config.get("compression_model", "microsoft/llmlingua-2-xlm-roberta-large-meetingbank"),
+                use_llmlingua2=True
+            )
+        return self._compressor
+    
+    def _compress_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        if not self.config.get("compress_prompt", False):
+            return request
+        
+        compressor = self._get_compressor()
+        if compressor is None:
+            return request
+        
+        # Keep Markdown structure markers so the requested layout survives compression
+        compressed = compressor.compress_prompt(
+            request["messages"][1]["content"],
+            rate=self.config.get("prompt_compression_rate", 0.4),
+            force_tokens=["\n", "#", "##", "```"]
+        )["compressed_prompt"]
+        
+        messages = [request["messages"][0], {"role": "user", "content": compressed}]
+        return {**request, "messages": messages}
+    
+    def _semantic_scope(self, config: CheatSheetConfig, model: str) -> str:
+        return SemanticCache.scope(
+            model=model,
+            embedding_model=self.config.get("embedding_model", "text-embedding-3-small"),
+            difficulty_level=config.difficulty_level,
+            sections=config.sections,
+            format_style=config.format_style,
+            include_examples=config.include_examples
+        )
+    
+    def _create_prompt(self, config: CheatSheetConfig) -> str:
+        base_prompt = f"""
+Create an EXTREMELY COMPREHENSIVE and DETAILED cheat sheet for {config.topic} targeted at {config.difficulty_level} level users.
+
+CRITICAL REQUIREMENTS:
+- Write EVERYTHING in ENGLISH language only
+- This must be a COMPLETE, PROFESSIONAL-GRADE reference document
+- Format: Rich, well-structured Markdown with extensive content
+- Style: {config.format_style} - but always err on the side of MORE content
+- Include examples: {config.include_examples} - provide MULTIPLE examples for each concept
+- Use proper Markdown syntax with headers, code blocks, tables, and lists
+- Add emojis for visual appeal and better organization
+- Include a detailed table of contents with clickable links
+- Organize content logically with MANY clear sections and subsections
+- Minimum 75+ code examples across different use cases
+- Include edge cases, advanced techniques, and real-world scenarios
+- For libraries: Focus extensively on the MOST COMMONLY USED and PRACTICAL methods/functions
+- For libraries: Include comprehensive method reference with parameters, return values, and examples
+
 """
         
-        return base_prompt + structure_guide
+        if config.sections:
+            base_prompt += f"Focus extensively on these sections with deep detail: {', '.join(config.sections)}\n"
+        
+        return base_prompt + _STRUCTURE_GUIDE_TMPL.substitute(topic=config.topic)
     
     def save_cheat_sheet(self, content: str, topic: str) -> str:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{topic.lower().replace(' ', '_')}_{timestamp}.md"
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        filename = f"{slugify(topic)}_{timestamp}.md"
         filepath = self.output_dir / filename
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
+            # Written as bytes so newlines are never translated to \r\n
+            filepath.write_bytes(content.encode("utf-8"))
             return str(filepath)
         except Exception as e:
             self.console.print(f"[red]Error saving file: {str(e)}[/red]")
@@ -292,7 +504,8 @@ TARGET: 8000+ words for truly comprehensive coverage.
     
     def create_cheat_sheet(self, topic: str, difficulty: str = "intermediate", 
                           sections: Optional[list] = None, format_style: str = "comprehensive",
-                          include_examples: bool = True, preview: bool = False) -> Optional[str]:
+                          include_examples: bool = True, preview: bool = False,
+                          use_cache: bool = True) -> Optional[str]:
         
         config = CheatSheetConfig(
             topic=topic,
@@ -305,7 +518,7 @@ TARGET: 8000+ words for truly comprehensive coverage.
         self.console.print(f"[yellow]🤖 Generating cheat sheet for: {topic}[/yellow]")
         self.console.print(f"[dim]Difficulty: {difficulty} | Style: {format_style}[/dim]")
         
-        content = self.generate_cheat_sheet(config)
+        content = self.generate_cheat_sheet(config, use_cache=use_cache)
         
         if not content:
             return None
@@ -319,4 +532,208 @@ TARGET: 8000+ words for truly comprehensive coverage.
             self.console.print(f"[green]✅ Cheat sheet saved to: {filepath}[/green]")
             return filepath
         
-        return None
\ No newline at end of file
+        return None
+    
+    def create_cheat_sheets_batch(self, topics: List[str], difficulty: str = "intermediate",
+                                  sections: Optional[list] = None, format_style: str = "comprehensive",
+                                  include_examples: bool = True, use_cache: bool = True) -> List[str]:
+        """Generate cheat sheets for several topics in one OpenAI Batch API job."""
+        
+        pending = {}
+        documents = []
+        
+        for index, topic in enumerate(topics):
+            config = CheatSheetConfig(
+                topic=topic,
+                difficulty_level=difficulty,
+                sections=sections,
+                format_style=format_style,
+                include_examples=include_examples
+            )
+            cached, prepared = self.prepare_batch_request(config, use_cache=use_cache)
+            if cached:
+                documents.append((cached, topic))
+                continue
+            
+            pending[f"cheat-sheet-{index}"] = (topic, prepared)
+        
+        if not pending:
+            return self.save_cheat_sheets(documents)
+        
+        try:
+            results = run_chat_batch(
+                self.client,
+                {custom_id: prepared["body"] for custom_id, (_, prepared) in pending.items()},
+                self.console,
+                poll_interval=self.config.get("batch_poll_interval", 30)
+            )
+        except Exception as e:
+            self.console.print(f"[red]Error running batch: {str(e)}[/red]")
+            return self.save_cheat_sheets(documents)
+        
+        for custom_id, (topic, prepared) in pending.items():
+            content, finish_reason = results[custom_id]
+            if not content:
+                self.console.print(f"[red]❌ No cheat sheet generated for: {topic}[/red]")
+                continue
+            
+            self.store_batch_result(prepared, content, finish_reason)
+            documents.append((content, topic))
+        
+        return self.save_cheat_sheets(documents)
+    
+    def save_cheat_sheets(self, documents: List[Tuple[str, str]]) -> List[str]:
+        """Save several (content, topic) pairs, overlapping the file writes on a thread pool."""
+        
+        with ThreadPoolExecutor(max_workers=min(8, len(documents) or 1)) as pool:
+            results = list(pool.map(lambda document: self.save_cheat_sheet(*document), documents))
+        
+        filepaths = []
+        for filepath in results:
+            if filepath:
+                self.console.print(f"[green]✅ Cheat sheet saved to: {filepath}[/green]")
+                filepaths.append(filepath)
+        return filepaths
+    
+    async def agenerate_cheat_sheet(self, config: CheatSheetConfig, semaphore: asyncio.Semaphore,
+                                    bucket: TokenBucket, use_cache: bool = True) -> Optional[str]:
+        request = self._build_request(config)
+        
+        model = request["model"]
+        temperature = request["temperature"]
+        
+        cache_key = self._cache_key(request)
+        
+        embedding = None
+        semantic_scope = self._semantic_scope(config, model)
+        
+        if use_cache:
+            cached = self.cache.get(cache_key)
+            if cached:
+                self.console.print(f"[green]⚡ Loaded cheat sheet for {config.topic} from cache[/green]")
+                return cached
+            
+            embedding = await aembed_text(
+                self._aclient.get(),
+                self.config.get("embedding_model", "text-embedding-3-small"),
+                config.topic
+            )
+            if embedding is not None:
+                cached, score = self.semantic_cache.find_cached(embedding, semantic_scope, self.cache)
+                
+                if cached and score >= self.config.get("semantic_cache_threshold", 0.93):
+                    self.console.print(f"[green]⚡ Loaded cheat sheet for {config.topic} from a similar topic in cache (similarity {score:.2f})[/green]")
+                    return cached
+                
+                if cached and score >= self.config.get("adapt_cache_threshold", 0.80):
+                    async with semaphore:
+                        adapted = await self._aadapt_cheat_sheet(cached, config, model, temperature, bucket)
+                    if adapted:
+                        self._store_cached(adapted, cache_key, embedding, semantic_scope)
+                        return adapted
+        
+        try:
+            async with semaphore:
+                # LLMLingua inference is CPU-bound; keep it off the event loop so other requests keep flowing
+                sent_request = await asyncio.to_thread(self._compress_request, request)
+                content, finish_reason = await self._acomplete(sent_request, bucket)
+                
+                continuation_request = self._continuation_request(sent_request, content, finish_reason)
+                if continuation_request:
+                    continuation, _ = await self._acomplete(continuation_request, bucket)
+                    content = content + "\n" + continuation
+        except Exception as e:
+            self.console.print(f"[red]Error generating cheat sheet for {config.topic}: {str(e)}[/red]")
+            return None
+        
+        if content:
+            self._store_cached(content, cache_key, embedding, semantic_scope)
+        
+        return content
+    
+    async def _acomplete(self, request: Dict[str, Any], bucket: TokenBucket) -> Tuple[str, Optional[str]]:
+        # Rate limits count the requested max_tokens against TPM, not just the prompt
+        await bucket.acquire(count_message_tokens(request["messages"], request["model"]) + request["max_tokens"])
+        response = await acall_with_retries(self._aclient.get().chat.completions.create, self.console, **request)
+        choice = response.choices[0]
+        return choice.message.content or "", choice.finish_reason
+    
+    async def acreate_cheat_sheet(self, topic: str, difficulty: str = "intermediate",
+                                  sections: Optional[list] = None, format_style: str = "comprehensive",
+                                  include_examples: bool = True, preview: bool = False,
+                                  use_cache: bool = True) -> Optional[str]:
+        """Async counterpart of create_cheat_sheet, for running alongside other generations."""
+        
+        config = CheatSheetConfig(
+            topic=topic,
+            difficulty_level=difficulty,
+            sections=sections,
+            format_style=format_style,
+            include_examples=include_examples
+        )
+        
+        self.console.print(f"[yellow]🤖 Generating cheat sheet for: {topic}[/yellow]")
+        
+        semaphore = asyncio.Semaphore(1)
+        bucket = TokenBucket(self.config.get("tokens_per_minute", 150000))
+        content = await self.agenerate_cheat_sheet(config, semaphore, bucket, use_cache=use_cache)
+        
+        if not content:
+            return None
+        
+        if preview:
+            self.preview_cheat_sheet(content)
+        
+        loop = asyncio.get_running_loop()
+        filepath = await loop.run_in_executor(None, self.save_cheat_sheet, content, topic)
+        
+        if filepath:
+            self.console.print(f"[green]✅ Cheat sheet saved to: {filepath}[/green]")
+            return filepath
+        
+        return None
+    
+    async def aclose(self):
+        """Close the async client; call before the event loop that used it shuts down."""
+        await self._aclient.aclose()
+    
+    def create_cheat_sheets_concurrently(self, topics: List[str], difficulty: str = "intermediate",
+                                         sections: Optional[list] = None, format_style: str = "comprehensive",
+                                         include_examples: bool = True, use_cache: bool = True) -> List[str]:
+        """Generate cheat sheets for several topics in parallel, within the configured rate limits."""
+        
+        async def run_all() -> List[Optional[str]]:
+            semaphore = asyncio.Semaphore(self.config.get("max_concurrent_requests", 4))
+            bucket = TokenBucket(self.config.get("tokens_per_minute", 150000))
+            
+            async def run_one(topic: str) -> Optional[str]:
+                config = CheatSheetConfig(
+                    topic=topic,
+                    difficulty_level=difficulty,
+                    sections=sections,
+                    format_style=format_style,
+                    include_examples=include_examples
+                )
+                content = await self.agenerate_cheat_sheet(config, semaphore, bucket, use_cache=use_cache)
+                if not content:
+                    self.console.print(f"[red]❌ No cheat sheet generated for: {topic}[/red]")
+                    return None
+                
+                # Write on a worker thread so other topics keep streaming in meanwhile
+                loop = asyncio.get_running_loop()
+                filepath = await loop.run_in_executor(None, self.save_cheat_sheet, content, topic)
+                if filepath:
+                    self.console.print(f"[green]✅ Cheat sheet saved to: {filepath}[/green]")
+                return filepath
+            
+            try:
+                return await asyncio.gather(*(run_one(topic) for topic in topics))
+            finally:
+                await self.aclose()
+        
+        return [filepath for filepath in asyncio.run(run_all()) if filepath]
+
+@lru_cache(maxsize=1)
+def get_cheat_sheet_agent() -> CheatSheetAgent:
+    """Return the agent shared by every command in this process."""
+    return CheatSheetAgent()
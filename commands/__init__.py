@@ -0,0 +1,4 @@
+from rich.console import Console
+
+# Shared by every command module so output goes through one console
+console = Console()
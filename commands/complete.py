@@ -0,0 +1,142 @@
+import click
+from rich.panel import Panel
+
+from commands import console
+
+@click.command(name='complete')
+@click.option('--topic', '-t', help='Topic to create both cheat sheet and practice for', required=True)
+@click.option('--difficulty', '-d', 
+              type=click.Choice(['beginner', 'intermediate', 'advanced']),
+              default='intermediate',
+              help='Difficulty level')
+@click.option('--exercises', '-e', type=int, default=20, help='Number of practice exercises')
+@click.option('--preview', '-p', is_flag=True, help='Preview before saving')
+@click.option('--batch', 'use_batch', is_flag=True, help='Use the OpenAI Batch API (50% cheaper, may take longer)')
+@click.option('--no-cache', is_flag=True, help='Skip the response caches and always call the API')
+def cmd(topic, difficulty, exercises, preview, use_batch, no_cache):
+    """Generate both cheat sheet and practice exercises for a topic."""
+    
+    import asyncio
+    import httpx
+    from cheat_sheet_agent import CheatSheetAgent
+    from practice_generator import PracticeGenerator
+    from llm_client import HTTP_LIMITS
+    
+    console.print(Panel.fit(
+        f"[bold yellow]🚀 COMPLETE LEARNING PACKAGE[/bold yellow]\n"
+        f"[dim]Creating cheat sheet + practice exercises for: [bold]{topic}[/bold][/dim]",
+        border_style="yellow"
+    ))
+    
+    if use_batch:
+        cheat_filepath, practice_filepath = _complete_with_batch(
+            CheatSheetAgent(), PracticeGenerator(), topic, difficulty, exercises, preview, not no_cache
+        )
+    else:
+        # The sync OpenAI client is already process-wide; the async pool is shared here so the
+        # concurrent cheat sheet and practice requests reuse one HTTP/2 connection
+        async_http_client = httpx.AsyncClient(http2=True, limits=HTTP_LIMITS)
+        cheat_agent = CheatSheetAgent(async_http_client=async_http_client)
+        practice_generator = PracticeGenerator(async_http_client=async_http_client)
+        
+        # Both documents are independent, so generate them concurrently
+        console.print("[cyan]📋🎯 Generating cheat sheet and practice exercises in parallel...[/cyan]")
+        
+        async def run():
+            try:
+                return await asyncio.gather(
+                    cheat_agent.acreate_cheat_sheet(
+                        topic=topic,
+                        difficulty=difficulty,
+                        preview=preview,
+                        use_cache=not no_cache
+                    ),
+                    practice_generator.acreate_practice_document(
+                        topic=topic,
+                        difficulty=difficulty,
+                        exercise_count=exercises,
+                        preview=preview,
+                        use_cache=not no_cache
+                    )
+                )
+            finally:
+                await cheat_agent.aclose()
+                await practice_generator.aclose()
+        
+        cheat_filepath, practice_filepath = asyncio.run(run())
+    
+    if cheat_filepath:
+        console.print(f"[green]✅ Cheat sheet created: {cheat_filepath}[/green]")
+    else:
+        console.print("[red]❌ Failed to create cheat sheet[/red]")
+    
+    if practice_filepath:
+        console.print(f"[green]✅ Practice document created: {practice_filepath}[/green]")
+    else:
+        console.print("[red]❌ Failed to create practice document[/red]")
+    
+    if cheat_filepath and practice_filepath:
+        console.print(f"\n[bold green]🎉 Complete learning package ready![/bold green]")
+        console.print("[dim]You now have both reference material and hands-on exercises![/dim]")
+
+def _complete_with_batch(cheat_agent, practice_generator, topic, difficulty, exercises, preview, use_cache):
+    """Generate both documents of a learning package in a single Batch API job."""
+    
+    from cheat_sheet_agent import CheatSheetConfig
+    from practice_generator import PracticeConfig
+    from batch import run_chat_batch
+    
+    documents = {
+        "cheat-sheet": (cheat_agent, CheatSheetConfig(topic=topic, difficulty_level=difficulty)),
+        "practice": (
+            practice_generator,
+            PracticeConfig(topic=topic, difficulty_level=difficulty, exercise_count=exercises)
+        )
+    }
+    
+    contents = {}
+    pending = {}
+    for custom_id, (generator, config) in documents.items():
+        cached, prepared = generator.prepare_batch_request(config, use_cache=use_cache)
+        if cached:
+            contents[custom_id] = cached
+        else:
+            pending[custom_id] = prepared
+    
+    if pending:
+        console.print(f"[cyan]📦 Submitting {len(pending)} document(s) as one batch...[/cyan]")
+        try:
+            results = run_chat_batch(
+                cheat_agent.client,
+                {custom_id: prepared["body"] for custom_id, prepared in pending.items()},
+                console,
+                poll_interval=cheat_agent.config.get("batch_poll_interval", 30)
+            )
+        except Exception as e:
+            console.print(f"[red]Error running batch: {str(e)}[/red]")
+            results = {}
+        
+        for custom_id, prepared in pending.items():
+            content, finish_reason = results.get(custom_id, (None, None))
+            if not content:
+                continue
+            
+            generator, _ = documents[custom_id]
+            generator.store_batch_result(prepared, content, finish_reason)
+            contents[custom_id] = content
+    
+    cheat_filepath = None
+    cheat_content = contents.get("cheat-sheet")
+    if cheat_content:
+        if preview:
+            cheat_agent.preview_cheat_sheet(cheat_content)
+        cheat_filepath = cheat_agent.save_cheat_sheet(cheat_content, topic)
+    
+    practice_filepath = None
+    practice_content = contents.get("practice")
+    if practice_content:
+        if preview:
+            practice_generator.preview_practice_document(practice_content)
+        practice_filepath = practice_generator.save_practice_document(practice_content, topic, difficulty)
+    
+    return cheat_filepath, practice_filepath
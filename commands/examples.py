@@ -0,0 +1,50 @@
+import click
+from rich.table import Table
+
+from commands import console
+
+# Rendered with a single print so Rich parses the markup and writes to the terminal once
+_EXAMPLES_TEXT = "\n".join([
+    "\n[bold yellow]📋 Cheat Sheet Commands:[/bold yellow]",
+    "• [dim]python main.py generate -t 'pandas' -d intermediate[/dim]",
+    "• [dim]python main.py generate -t 'React Hooks' -f quick-reference --preview[/dim]",
+    "• [dim]python main.py generate -t 'Docker' -s 'commands,dockerfile,compose'[/dim]",
+    "• [dim]python main.py generate-many -i topics.txt -d beginner[/dim]",
+    "• [dim]python main.py generate-concurrent -i topics.txt[/dim]",
+    "• [dim]python main.py interactive[/dim]",
+    "\n[bold green]🎯 Practice Exercise Commands:[/bold green]",
+    "• [dim]python main.py practice -t 'pandas' -d intermediate -c 25[/dim]",
+    "• [dim]python main.py practice -t 'JavaScript' -d advanced --preview[/dim]",
+    "• [dim]python main.py practice -t 'React' -f 'hooks,state,components'[/dim]",
+    "• [dim]python main.py practice-interactive[/dim]",
+    "\n[bold yellow]🚀 Complete Learning Package:[/bold yellow]",
+    "• [dim]python main.py complete -t 'pandas' -d intermediate -e 30[/dim]",
+    "• [dim]python main.py complete -t 'Docker' -d beginner --preview[/dim]",
+    "• [dim]python main.py complete -t 'Rust' --batch[/dim]",
+    "\n[bold cyan]💡 Pro Tips:[/bold cyan]",
+    "• Use [bold]complete[/bold] command to get both cheat sheet + practice exercises",
+    "• Use [bold]--preview[/bold] flag to see content before saving",
+    "• Practice exercises include solutions, projects, and debugging challenges",
+    "• Mix difficulty levels with [bold]-d mixed[/bold] for progressive learning",
+])
+
+@click.command(name='examples')
+def cmd():
+    """Show example commands and topics."""
+    
+    console.print("[bold blue]📚 Example Topics & Commands[/bold blue]\n")
+    
+    table = Table(title="Popular Topics")
+    table.add_column("Category", style="cyan")
+    table.add_column("Examples", style="green")
+    
+    table.add_row("Python Libraries", "pandas, numpy, matplotlib, scikit-learn, tensorflow")
+    table.add_row("Web Frameworks", "React, Vue.js, Django, Flask, FastAPI")
+    table.add_row("Databases", "PostgreSQL, MongoDB, Redis, SQLite")
+    table.add_row("DevOps", "Docker, Kubernetes, AWS, Git, Linux")
+    table.add_row("Machine Learning", "PyTorch, Hugging Face, OpenCV, NLTK")
+    table.add_row("Languages", "JavaScript, Python, Go, Rust, TypeScript")
+    
+    console.print(table)
+    
+    console.print(_EXAMPLES_TEXT)
@@ -0,0 +1,51 @@
+import click
+from rich.panel import Panel
+
+from commands import console
+
+@click.command(name='generate')
+@click.option('--topic', '-t', help='Technology/topic for the cheat sheet', required=True)
+@click.option('--difficulty', '-d', 
+              type=click.Choice(['beginner', 'intermediate', 'advanced']),
+              default='intermediate',
+              help='Difficulty level')
+@click.option('--format-style', '-f',
+              type=click.Choice(['quick-reference', 'comprehensive']),
+              default='comprehensive',
+              help='Format style')
+@click.option('--no-examples', is_flag=True, help='Exclude code examples')
+@click.option('--preview', '-p', is_flag=True, help='Preview before saving')
+@click.option('--sections', '-s', help='Comma-separated list of specific sections to include')
+@click.option('--no-cache', is_flag=True, help='Ignore cached results and always call the API')
+def cmd(topic, difficulty, format_style, no_examples, preview, sections, no_cache):
+    """Generate a cheat sheet for a specific technology or topic."""
+    
+    from cheat_sheet_agent import get_cheat_sheet_agent
+    
+    console.print(Panel.fit(
+        f"[bold blue]🚀 AI CHEAT SHEET GENERATOR[/bold blue]\n"
+        f"[dim]Creating cheat sheet for: [bold]{topic}[/bold][/dim]",
+        border_style="blue"
+    ))
+    
+    agent = get_cheat_sheet_agent()
+    
+    sections_list = None
+    if sections:
+        sections_list = [s.strip() for s in sections.split(',')]
+    
+    filepath = agent.create_cheat_sheet(
+        topic=topic,
+        difficulty=difficulty,
+        sections=sections_list,
+        format_style=format_style,
+        include_examples=not no_examples,
+        preview=preview,
+        use_cache=not no_cache
+    )
+    
+    if filepath:
+        console.print(f"\n[green]🎉 Successfully created cheat sheet![/green]")
+        console.print(f"[dim]File location: {filepath}[/dim]")
+    else:
+        console.print("[red]❌ Failed to generate cheat sheet[/red]")
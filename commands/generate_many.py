@@ -0,0 +1,47 @@
+import click
+from rich.panel import Panel
+
+from commands import console
+
+@click.command(name='generate-many')
+@click.option('--topics-file', '-i', type=click.File('r', encoding='utf-8'), required=True,
+              help='File with one topic per line')
+@click.option('--difficulty', '-d', 
+              type=click.Choice(['beginner', 'intermediate', 'advanced']),
+              default='intermediate',
+              help='Difficulty level')
+@click.option('--format-style', '-f',
+              type=click.Choice(['quick-reference', 'comprehensive']),
+              default='comprehensive',
+              help='Format style')
+@click.option('--no-examples', is_flag=True, help='Exclude code examples')
+@click.option('--no-cache', is_flag=True, help='Ignore cached results and always call the API')
+def cmd(topics_file, difficulty, format_style, no_examples, no_cache):
+    """Generate cheat sheets for many topics at once using the OpenAI Batch API (50% cheaper, up to 24h)."""
+    
+    from cheat_sheet_agent import get_cheat_sheet_agent
+    
+    topics = [line.strip() for line in topics_file if line.strip() and not line.startswith('#')]
+    if not topics:
+        console.print("[red]❌ No topics found in the topics file[/red]")
+        return
+    
+    console.print(Panel.fit(
+        f"[bold blue]📦 BATCH CHEAT SHEET GENERATOR[/bold blue]\n"
+        f"[dim]Creating {len(topics)} cheat sheet(s) via the Batch API[/dim]",
+        border_style="blue"
+    ))
+    
+    agent = get_cheat_sheet_agent()
+    filepaths = agent.create_cheat_sheets_batch(
+        topics=topics,
+        difficulty=difficulty,
+        format_style=format_style,
+        include_examples=not no_examples,
+        use_cache=not no_cache
+    )
+    
+    if filepaths:
+        console.print(f"\n[green]🎉 Successfully created {len(filepaths)}/{len(topics)} cheat sheet(s)![/green]")
+    else:
+        console.print("[red]❌ Failed to generate cheat sheets[/red]")
@@ -0,0 +1,60 @@
+import click
+from rich.prompt import Prompt, Confirm
+from rich.panel import Panel
+
+from commands import console
+
+@click.command(name='interactive')
+def cmd():
+    """Interactive mode for creating cheat sheets."""
+    
+    from cheat_sheet_agent import get_cheat_sheet_agent
+    
+    console.print(Panel.fit(
+        "[bold blue]🤖 INTERACTIVE CHEAT SHEET GENERATOR[/bold blue]\n"
+        "[dim]Let's create your perfect cheat sheet![/dim]",
+        border_style="blue"
+    ))
+    
+    topic = Prompt.ask("[bold]What technology/topic would you like a cheat sheet for?[/bold]")
+    
+    difficulty = Prompt.ask(
+        "[bold]Difficulty level[/bold]",
+        choices=['beginner', 'intermediate', 'advanced'],
+        default='intermediate'
+    )
+    
+    format_style = Prompt.ask(
+        "[bold]Format style[/bold]",
+        choices=['quick-reference', 'comprehensive'],
+        default='comprehensive'
+    )
+    
+    include_examples = Confirm.ask("[bold]Include code examples?[/bold]", default=True)
+    
+    sections_input = Prompt.ask(
+        "[bold]Specific sections to include[/bold] (comma-separated, or press Enter for all)",
+        default=""
+    )
+    
+    sections_list = None
+    if sections_input.strip():
+        sections_list = [s.strip() for s in sections_input.split(',')]
+    
+    preview = Confirm.ask("[bold]Preview before saving?[/bold]", default=False)
+    
+    agent = get_cheat_sheet_agent()
+    filepath = agent.create_cheat_sheet(
+        topic=topic,
+        difficulty=difficulty,
+        sections=sections_list,
+        format_style=format_style,
+        include_examples=include_examples,
+        preview=preview
+    )
+    
+    if filepath:
+        console.print(f"\n[green]🎉 Successfully created cheat sheet![/green]")
+        console.print(f"[dim]File location: {filepath}[/dim]")
+    else:
+        console.print("[red]❌ Failed to generate cheat sheet[/red]")
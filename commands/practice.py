@@ -0,0 +1,50 @@
+import click
+from rich.panel import Panel
+
+from commands import console
+
+@click.command(name='practice')
+@click.option('--topic', '-t', help='Technology/topic for practice exercises', required=True)
+@click.option('--difficulty', '-d', 
+              type=click.Choice(['beginner', 'intermediate', 'advanced', 'mixed']),
+              default='intermediate',
+              help='Difficulty level')
+@click.option('--count', '-c', type=int, default=20, help='Number of exercises to generate')
+@click.option('--no-solutions', is_flag=True, help='Exclude detailed solutions')
+@click.option('--preview', '-p', is_flag=True, help='Preview before saving')
+@click.option('--focus', '-f', help='Comma-separated list of focus areas')
+@click.option('--batch', 'use_batch', is_flag=True, help='Use the OpenAI Batch API (50% cheaper, may take longer)')
+@click.option('--no-cache', is_flag=True, help='Skip the response cache and always call the API')
+def cmd(topic, difficulty, count, no_solutions, preview, focus, use_batch, no_cache):
+    """Generate comprehensive practice exercises for a specific technology or topic."""
+    
+    from practice_generator import get_practice_generator
+    
+    console.print(Panel.fit(
+        f"[bold green]🎯 AI PRACTICE GENERATOR[/bold green]\n"
+        f"[dim]Creating practice exercises for: [bold]{topic}[/bold][/dim]",
+        border_style="green"
+    ))
+    
+    generator = get_practice_generator()
+    
+    focus_areas = None
+    if focus:
+        focus_areas = [area.strip() for area in focus.split(',')]
+    
+    filepath = generator.create_practice_document(
+        topic=topic,
+        difficulty=difficulty,
+        exercise_count=count,
+        include_solutions=not no_solutions,
+        focus_areas=focus_areas,
+        preview=preview,
+        use_batch=use_batch,
+        use_cache=not no_cache
+    )
+    
+    if filepath:
+        console.print(f"\n[green]🎉 Successfully created practice document![/green]")
+        console.print(f"[dim]File location: {filepath}[/dim]")
+    else:
+        console.print("[red]❌ Failed to generate practice document[/red]")
@@ -0,0 +1,17 @@
+import click
+
+from commands import console
+
+@click.command(name='practice-interactive')
+def cmd():
+    """Interactive mode for creating practice exercises."""
+    from practice_generator import get_practice_generator
+    
+    generator = get_practice_generator()
+    filepath = generator.interactive_practice_creation()
+    
+    if filepath:
+        console.print(f"\n[green]🎉 Successfully created practice document![/green]")
+        console.print(f"[dim]File location: {filepath}[/dim]")
+    else:
+        console.print("[red]❌ Failed to generate practice document[/red]")
@@ -0,0 +1,21 @@
+import click
+
+from commands import console
+
+@click.command(name='setup')
+def cmd():
+    """Setup the environment and API key."""
+    
+    console.print("[bold blue]🔧 Environment Setup[/bold blue]\n")
+    
+    console.print("1. Install dependencies:")
+    console.print("   [dim]pip install -r requirements.txt[/dim]\n")
+    
+    console.print("2. Set up your OpenAI API key:")
+    console.print("   [dim]cp .env.example .env[/dim]")
+    console.print("   [dim]# Edit .env file and add your API key[/dim]\n")
+    
+    console.print("3. Create your first cheat sheet:")
+    console.print("   [dim]python main.py interactive[/dim]\n")
+    
+    console.print("[yellow]💡 Get your OpenAI API key from: https://platform.openai.com/api-keys[/yellow]")
@@ -1,19 +1,58 @@
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
-import json
+from typing import Any, Optional
+
+import orjson
+from dotenv import load_dotenv
+
+@lru_cache(maxsize=None)
+def _load_env():
+    # Config reads OPENAI_API_KEY from the environment, so .env must be loaded first; once is enough
+    load_dotenv()
+
+# Characters in a topic that are replaced when building file names
+_SLUG_TABLE = str.maketrans({' ': '_', '\t': '_', '/': '_'})
+
+def slugify(topic: str) -> str:
+    """Turn a topic into the file-name stem used for saved documents."""
+    return topic.lower().translate(_SLUG_TABLE)
 
 class Config:
+    _instance = None
+    
+    def __new__(cls):
+        # Share one instance per process; reload only when the file changed on disk
+        instance = cls._instance
+        if instance is not None and instance._mtime == instance._file_mtime():
+            return instance
+        
+        instance = super().__new__(cls)
+        instance._initialized = False
+        cls._instance = instance
+        return instance
+    
     def __init__(self):
+        if self._initialized:
+            return
+        
         self.config_dir = Path.home() / ".cheat_sheet_agent"
         self.config_file = self.config_dir / "config.json"
         self.ensure_config_dir()
         self.load_config()
+        self._initialized = True
+    
+    def _file_mtime(self) -> Optional[int]:
+        try:
+            return self.config_file.stat().st_mtime_ns
+        except OSError:
+            return None
     
     def ensure_config_dir(self):
         self.config_dir.mkdir(exist_ok=True)
     
     def load_config(self):
+        _load_env()
         self.default_config = {
             "openai_api_key": os.getenv("OPENAI_API_KEY", ""),
             "default_difficulty": "intermediate",
@@ -22,21 +61,36 @@ class Config:
             "output_directory": "cheat_sheets",
             "model": "gpt-4o",
             "max_tokens": 16000,
-            "temperature": 0.7
+            "temperature": 0.7,
+            "embedding_model": "text-embedding-3-small",
+            "semantic_cache_threshold": 0.93,
+            "adapt_cache_threshold": 0.80,
+            "adapt_max_tokens": 6000,
+            "batch_poll_interval": 30,
+            "max_concurrent_requests": 4,
+            "tokens_per_minute": 150000,
+            "compress_prompt": False,
+            "compression_model": "microsoft/llmlingua-2-xlm-roberta-large-meetingbank",
+            "prompt_compression_rate": 0.4,
+            "stream_stall_timeout": 30,
+            "practice_cache_ttl_days": 7,
+            "practice_semantic_cache_threshold": 0.95
         }
         
-        if self.config_file.exists():
+        self._mtime = self._file_mtime()
+        if self._mtime is not None:
             try:
-                with open(self.config_file, 'r') as f:
-                    saved_config = json.load(f)
+                with open(self.config_file, 'rb') as f:
+                    saved_config = orjson.loads(f.read())
                     self.default_config.update(saved_config)
-            except (json.JSONDecodeError, IOError):
+            except (orjson.JSONDecodeError, IOError):
                 pass
     
     def save_config(self):
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.default_config, f, indent=2)
+            with open(self.config_file, 'wb') as f:
+                f.write(orjson.dumps(self.default_config, option=orjson.OPT_INDENT_2))
+            self._mtime = self._file_mtime()
         except IOError:
             pass
     
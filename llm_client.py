@@ -0,0 +1,187 @@
+import time
+import random
+import asyncio
+from functools import lru_cache
+from typing import Optional, Tuple, Callable, Awaitable, TypeVar
+
+import httpx
+import openai
+from rich.console import Console
+
+T = TypeVar("T")
+
+# Transient failures worth retrying; anything else (bad request, auth) fails immediately.
+# httpx.TransportError covers connections dropped while a stream is being read.
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+    httpx.TransportError,
+)
+MAX_ATTEMPTS = 4
+# Retries are handled by call_with_retries, so clients are built with the SDK's own retries off;
+# otherwise each attempt here would fan out into the SDK's attempts as well
+SDK_MAX_RETRIES = 0
+
+
+# Keep idle connections open between requests so follow-up calls skip the TLS handshake
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, keepalive_expiry=30.0)
+
+# A stream still below this size after its stall timeout is abandoned
+STALL_MIN_CHARS = 500
+# finish_reason reported for a stream abandoned by stall detection
+STALLED = "stalled"
+# Finish reasons after which the document stopped early and is worth continuing
+TRUNCATED_FINISH_REASONS = ("length", STALLED)
+# Overall request timeout, the SDK default; only the read timeout is tightened for stall detection
+REQUEST_TIMEOUT = 600.0
+
+
+@lru_cache(maxsize=1)
+def get_openai_client(api_key: str) -> openai.OpenAI:
+    """Return the process-wide OpenAI client so every generator reuses its pooled HTTP/2 connections."""
+    return openai.OpenAI(
+        api_key=api_key,
+        http_client=httpx.Client(http2=True, limits=HTTP_LIMITS),
+        max_retries=SDK_MAX_RETRIES
+    )
+
+
+def _is_retryable(error: Exception) -> bool:
+    # A 429 for an exhausted quota never clears by waiting
+    if isinstance(error, openai.RateLimitError) and getattr(error, "code", None) == "insufficient_quota":
+        return False
+    return isinstance(error, RETRYABLE_ERRORS)
+
+
+class LazyAsyncClient:
+    """AsyncOpenAI client created on first use.
+
+    Async connections are bound to the running event loop, so unlike get_openai_client this is
+    kept per owner and must be closed with aclose before that loop shuts down.
+    """
+
+    def __init__(self, api_key: str, http_client: Optional[httpx.AsyncClient] = None):
+        self.api_key = api_key
+        self.http_client = http_client
+        self._client: Optional[openai.AsyncOpenAI] = None
+
+    def get(self) -> openai.AsyncOpenAI:
+        if self._client is None:
+            self._client = openai.AsyncOpenAI(
+                api_key=self.api_key,
+                http_client=self.http_client or httpx.AsyncClient(http2=True, limits=HTTP_LIMITS),
+                max_retries=SDK_MAX_RETRIES
+            )
+        return self._client
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+
+def _embedding_input(text: str) -> str:
+    # Case and spacing differences should not change the embedding
+    return " ".join(text.lower().split())
+
+
+def embed_text(client, model: str, text: str) -> Optional[list]:
+    """Return the embedding of ``text``, or None if the request fails."""
+    try:
+        response = client.embeddings.create(model=model, input=_embedding_input(text))
+        return response.data[0].embedding
+    except Exception:
+        return None
+
+
+async def aembed_text(client, model: str, text: str) -> Optional[list]:
+    """Async counterpart of embed_text."""
+    try:
+        response = await client.embeddings.create(model=model, input=_embedding_input(text))
+        return response.data[0].embedding
+    except Exception:
+        return None
+
+
+def _retry_delay(attempt: int) -> float:
+    # 1s, 2s, 4s plus jitter so concurrent callers do not retry in lockstep
+    return 2 ** attempt + random.random()
+
+
+def call_with_retries(fn: Callable[..., T], console: Console, *args, **kwargs) -> T:
+    """Call ``fn``, retrying transient OpenAI errors with exponential backoff.
+
+    The error from the last of ``MAX_ATTEMPTS`` attempts is re-raised.
+    """
+    for attempt in range(MAX_ATTEMPTS):
+        try:
+            return fn(*args, **kwargs)
+        except RETRYABLE_ERRORS as e:
+            if attempt == MAX_ATTEMPTS - 1 or not _is_retryable(e):
+                raise
+            delay = _retry_delay(attempt)
+            console.print(f"[yellow]⚠️ {type(e).__name__}, retrying in {delay:.1f}s...[/yellow]")
+            time.sleep(delay)
+
+
+async def acall_with_retries(fn: Callable[..., Awaitable[T]], console: Console, *args, **kwargs) -> T:
+    """Async counterpart of call_with_retries."""
+    for attempt in range(MAX_ATTEMPTS):
+        try:
+            return await fn(*args, **kwargs)
+        except RETRYABLE_ERRORS as e:
+            if attempt == MAX_ATTEMPTS - 1 or not _is_retryable(e):
+                raise
+            delay = _retry_delay(attempt)
+            console.print(f"[yellow]⚠️ {type(e).__name__}, retrying in {delay:.1f}s...[/yellow]")
+            await asyncio.sleep(delay)
+
+
+def stream_completion(client, console: Console, stall_timeout: Optional[float] = None,
+                      **kwargs) -> Tuple[str, Optional[str]]:
+    """Stream a chat completion and return ``(content, finish_reason)``.
+
+    Deltas are collected in a list and joined once. With ``stall_timeout`` set, the stream is
+    closed early when it has produced fewer than ``STALL_MIN_CHARS`` characters after that many
+    seconds, or when no data arrives for that long; ``finish_reason`` is then ``STALLED``.
+    A transient failure at any point, including mid-stream, restarts the request.
+    """
+    return call_with_retries(_stream_once, console, client, console, stall_timeout, **kwargs)
+
+
+def _stream_once(client, console: Console, stall_timeout: Optional[float] = None,
+                 **kwargs) -> Tuple[str, Optional[str]]:
+    if stall_timeout:
+        # A silent connection otherwise blocks for the full read timeout before the checks
+        # below ever run, so bound every wait for data by the stall timeout itself
+        kwargs["timeout"] = httpx.Timeout(REQUEST_TIMEOUT, read=stall_timeout)
+
+    parts = []
+    total_chars = 0
+    stalled = False
+    finish_reason = None
+    started = time.monotonic()
+    with console.status("[yellow]✍️ Waiting for the first tokens...[/yellow]") as status:
+        try:
+            response = client.chat.completions.create(stream=True, **kwargs)
+            for chunk in response:
+                if chunk.choices:
+                    finish_reason = chunk.choices[0].finish_reason or finish_reason
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        parts.append(delta)
+                        total_chars += len(delta)
+                        status.update(f"[yellow]✍️ Receiving content... {total_chars:,} characters[/yellow]")
+
+                if (stall_timeout and total_chars < STALL_MIN_CHARS
+                        and time.monotonic() - started > stall_timeout):
+                    response.close()
+                    stalled = True
+                    break
+        except (openai.APITimeoutError, httpx.TimeoutException):
+            if not stall_timeout:
+                raise
+            stalled = True
+
+    return "".join(parts), STALLED if stalled else finish_reason
@@ -1,152 +1,43 @@
-import os
-import json
-from datetime import datetime
-from typing import Optional, Dict, Any, List
+import asyncio
+import string
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple
 from pathlib import Path
 
-import openai
-from dotenv import load_dotenv
-from pydantic import BaseModel, Field
-from rich.console import Console
+import httpx
+from rich.console import Console, Group
 from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
-from config import Config
+from rich.text import Text
+from config import Config, slugify
+from cache import ResponseCache, SemanticCache
+from batch import run_chat_batch
+from tokens import count_tokens, budget_max_tokens
+from llm_client import (TRUNCATED_FINISH_REASONS, LazyAsyncClient, acall_with_retries,
+                        aembed_text, embed_text, get_openai_client, stream_completion)
 
-load_dotenv()
+# The structure guide in the user prompt already spells out what the document must contain
+SYSTEM_PROMPT = "You are an expert coding instructor who writes progressive, hands-on practice exercises with complete solutions."
 
-class PracticeConfig(BaseModel):
-    topic: str = Field(..., description="The technology or topic for practice exercises")
-    difficulty_level: str = Field(default="intermediate", description="beginner, intermediate, or advanced")
-    exercise_count: int = Field(default=20, description="Number of exercises to generate")
-    include_solutions: bool = Field(default=True, description="Include detailed solutions")
-    exercise_types: Optional[List[str]] = Field(default=None, description="Types of exercises to include")
-    focus_areas: Optional[List[str]] = Field(default=None, description="Specific areas to focus on")
+# Output budget per practice document: a fixed allowance for the shared sections plus this much per exercise
+TOKENS_PER_EXERCISE = 300
+BASE_DOCUMENT_TOKENS = 2000
 
-class PracticeGenerator:
-    def __init__(self):
-        self.config = Config()
-        api_key = self.config.get_api_key()
-        
-        if not api_key:
-            raise ValueError("OpenAI API key not found. Please set OPENAI_API_KEY in .env file or config.")
-        
-        self.client = openai.OpenAI(api_key=api_key)
-        self.console = Console()
-        
-        output_dir_name = self.config.get("output_directory", "cheat_sheets")
-        self.output_dir = Path(output_dir_name)
-        self.output_dir.mkdir(exist_ok=True)
-        
-        # Create practices subdirectory
-        self.practice_dir = self.output_dir / "practices"
-        self.practice_dir.mkdir(exist_ok=True)
-    
-    def generate_practice_exercises(self, config: PracticeConfig) -> str:
-        prompt = self._create_practice_prompt(config)
-        
-        try:
-            response = self.client.chat.completions.create(
-                model=self.config.get("model", "gpt-4"),
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert educator and practical coding instructor who creates comprehensive, progressive practice exercises. Your exercises are designed to build real-world skills through hands-on learning, ranging from basic concepts to complex applications. You create exercises that simulate actual work scenarios and challenges developers face."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=self.config.get("temperature", 0.7),
-                max_tokens=self.config.get("max_tokens", 16000)
-            )
-            
-            content = response.choices[0].message.content
-            
-            # Check if content needs to be more comprehensive
-            if len(content) < 6000:
-                self.console.print("[yellow]⚠️ Generating more comprehensive exercises...[/yellow]")
-                
-                enhanced_prompt = f"""
-The previous response was too brief. Please create a MUCH MORE COMPREHENSIVE practice document for {config.topic}.
+# Documents shorter than this are extended with a follow-up request
+MIN_CONTENT_CHARS = 6000
 
-REQUIREMENTS:
-- Write EVERYTHING in ENGLISH language only
-- Minimum 10,000+ words
-- Include at least {config.exercise_count} detailed exercises
-- Progressive difficulty from basic to advanced
-- Real-world scenarios and projects
-- Complete solutions with explanations
-- Multiple approaches for complex problems
-- Industry-standard practices and patterns
+PREVIEW_CHARS = 2000
+_PREVIEW_SUFFIX = "\n\n... [Document continues with full exercises and solutions]"
 
-{prompt}
+CONTINUE_PROMPT = "Continue the document from where you stopped, adding the remaining exercises and sections. Do not repeat anything you already wrote."
 
-IMPORTANT: Make this a complete practical learning resource with extensive exercises and detailed solutions.
-"""
-                
-                response = self.client.chat.completions.create(
-                    model=self.config.get("model", "gpt-4o"),
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are an expert practical coding instructor who creates extremely comprehensive, detailed practice documents. Never provide brief content - always create extensive, complete practical learning resources."
-                        },
-                        {
-                            "role": "user",
-                            "content": enhanced_prompt
-                        }
-                    ],
-                    temperature=self.config.get("temperature", 0.7),
-                    max_tokens=self.config.get("max_tokens", 16000)
-                )
-                content = response.choices[0].message.content
-            
-            return content
-            
-        except Exception as e:
-            self.console.print(f"[red]Error generating practice exercises: {str(e)}[/red]")
-            return None
-    
-    def _create_practice_prompt(self, config: PracticeConfig) -> str:
-        exercise_types = config.exercise_types or [
-            "Basic Concepts", 
-            "Practical Applications", 
-            "Problem Solving", 
-            "Real-world Projects", 
-            "Code Debugging", 
-            "Performance Optimization",
-            "Best Practices",
-            "Integration Challenges"
-        ]
-        
-        base_prompt = f"""
-Create an EXTREMELY COMPREHENSIVE and PRACTICAL exercise document for {config.topic} targeted at {config.difficulty_level} level learners.
-
-CRITICAL REQUIREMENTS:
-- Write EVERYTHING in ENGLISH language only
-- This must be a COMPLETE, HANDS-ON learning resource
-- Format: Rich, well-structured Markdown with extensive practical content
-- Difficulty Level: {config.difficulty_level} - but include progressive difficulty
-- Include solutions: {config.include_solutions} - provide DETAILED solutions with explanations
-- Number of exercises: {config.exercise_count}+ exercises across different categories
-- Use proper Markdown syntax with headers, code blocks, tables, and lists
-- Add emojis for visual appeal and better organization
-- Include a detailed table of contents with clickable links
-- Organize exercises by category and difficulty
-- Include real-world scenarios and industry-standard problems
-- Provide multiple solution approaches where applicable
-- Include code reviews and best practice explanations
-"""
-        
-        if config.focus_areas:
-            base_prompt += f"Focus extensively on these areas: {', '.join(config.focus_areas)}\n"
-        
-        structure_guide = f"""
+_STRUCTURE_GUIDE_TMPL = string.Template("""
 MANDATORY STRUCTURE - Each section must be COMPREHENSIVE:
 
-# 🎯 {config.topic} - Comprehensive Practice Exercises
+# 🎯 $topic - Comprehensive Practice Exercises
 
 ## 📑 Table of Contents
 (Detailed TOC with all exercise categories and individual exercises)
@@ -165,7 +56,7 @@ MANDATORY STRUCTURE - Each section must be COMPREHENSIVE:
 
 ## 🎓 Exercise Categories
 
-### 🌱 Beginner Level ({config.exercise_count//4} exercises)
+### 🌱 Beginner Level ($exercise_count_q exercises)
 **Category 1: Fundamentals & Basic Syntax**
 - Exercise 1: [Title] - [Brief description]
   - **Objective**: Clear learning goal
@@ -183,17 +74,17 @@ MANDATORY STRUCTURE - Each section must be COMPREHENSIVE:
 **Category 2: Basic Operations**
 [Similar structure for each exercise]
 
-### 🌿 Intermediate Level ({config.exercise_count//3} exercises)
+### 🌿 Intermediate Level ($exercise_count_t exercises)
 **Category 3: Practical Applications**
 **Category 4: Data Manipulation & Processing**
 **Category 5: Problem Solving Patterns**
 
-### 🌳 Advanced Level ({config.exercise_count//3} exercises)
+### 🌳 Advanced Level ($exercise_count_t exercises)
 **Category 6: Complex Scenarios**
 **Category 7: Performance Optimization**
 **Category 8: Integration & Real-world Projects**
 
-### 🚀 Expert Level ({config.exercise_count//4} exercises)
+### 🚀 Expert Level ($exercise_count_q exercises)
 **Category 9: Advanced Techniques**
 **Category 10: System Design & Architecture**
 
@@ -297,12 +188,12 @@ CONTENT REQUIREMENTS:
 - Add exercises for different development environments
 
 SPECIAL FOCUS AREAS:
-{', '.join(exercise_types)}
+$types
 
-The practice document should be so comprehensive that someone could master {config.topic} through these exercises alone, progressing from complete beginner to advanced practitioner.
+The practice document should be so comprehensive that someone could master $topic through these exercises alone, progressing from complete beginner to advanced practitioner.
 
 MINIMUM REQUIREMENTS:
-- {config.exercise_count}+ individual exercises
+- $exercise_count+ individual exercises
 - 5+ complete mini-projects
 - 10+ debugging challenges
 - 10+ code review exercises
@@ -311,35 +202,355 @@ MINIMUM REQUIREMENTS:
 - Complete solutions with detailed explanations
 
 TARGET: 10,000+ words for truly comprehensive practical learning.
+""")
+
+@dataclass(frozen=True)
+class PracticeConfig:
+    topic: str                                     # The technology or topic for practice exercises
+    difficulty_level: str = "intermediate"         # beginner, intermediate, or advanced
+    exercise_count: int = 20                       # Number of exercises to generate
+    include_solutions: bool = True                 # Include detailed solutions
+    exercise_types: Optional[List[str]] = None     # Types of exercises to include
+    focus_areas: Optional[List[str]] = None        # Specific areas to focus on
+
+class PracticeGenerator:
+    def __init__(self, async_http_client: Optional[httpx.AsyncClient] = None):
+        self.config = Config()
+        api_key = self.config.get_api_key()
+        
+        if not api_key:
+            raise ValueError("OpenAI API key not found. Please set OPENAI_API_KEY in .env file or config.")
+        
+        self.api_key = api_key
+        self.client = get_openai_client(api_key)
+        self._aclient = LazyAsyncClient(api_key, async_http_client)
+        self.console = Console()
+        
+        # Read once; these are needed for every request and the cache key
+        self._model = self.config.get("model", "gpt-4")
+        self._temp = self.config.get("temperature", 0.7)
+        self._max_tokens = self.config.get("max_tokens", 16000)
+        self._embedding_model = self.config.get("embedding_model", "text-embedding-3-small")
+        self._semantic_threshold = self.config.get("practice_semantic_cache_threshold", 0.95)
+        
+        output_dir_name = self.config.get("output_directory", "cheat_sheets")
+        self.output_dir = Path(output_dir_name)
+        self.output_dir.mkdir(exist_ok=True)
+        
+        # Create practices subdirectory
+        self.practice_dir = self.output_dir / "practices"
+        self.practice_dir.mkdir(exist_ok=True)
+        
+        cache_ttl = self.config.get("practice_cache_ttl_days", 7) * 24 * 60 * 60
+        self.cache = ResponseCache(self.practice_dir / ".cache", ttl=cache_ttl)
+        self.semantic_cache = SemanticCache(self.practice_dir / ".sem_cache.npz")
+    
+    def generate_practice_exercises(self, config: PracticeConfig, use_batch: bool = False,
+                                    use_cache: bool = True) -> str:
+        request = self._build_request(config)
+        cache_key = self._cache_key(request)
+        
+        embedding = None
+        semantic_scope = self._semantic_scope(config)
+        
+        if use_cache:
+            cached, embedding = self._lookup_cached(config, cache_key, semantic_scope)
+            if cached:
+                return cached
+        
+        if use_batch:
+            content, finish_reason = self._generate_with_batch(request)
+        else:
+            content, finish_reason = self._generate_with_stream(request)
+        
+        self._store_cached(content, finish_reason, cache_key, embedding, semantic_scope)
+        return content
+    
+    def _lookup_cached(self, config: PracticeConfig, cache_key: str,
+                       semantic_scope: str) -> Tuple[Optional[str], Optional[list]]:
+        """Return a cached practice document for this request if there is one, and the topic embedding."""
+        cached = self.cache.get(cache_key)
+        if cached:
+            self.console.print(f"[green]⚡ Loaded practice document for {config.topic} from cache[/green]")
+            return cached, None
+        
+        embedding = embed_text(self.client, self._embedding_model, config.topic)
+        return self._similar_cached(embedding, semantic_scope), embedding
+    
+    def _store_cached(self, content: Optional[str], finish_reason: Optional[str], cache_key: str,
+                      embedding: Optional[list], semantic_scope: str):
+        if content and self._is_complete(finish_reason):
+            self.cache.set(cache_key, content)
+            if embedding is not None:
+                self.semantic_cache.add(embedding, cache_key, semantic_scope)
+    
+    def _generate_with_stream(self, request: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+        try:
+            content, finish_reason = stream_completion(self.client, self.console, **request)
+            
+            # Short or cut-off documents are extended from where they stopped instead of regenerated
+            continuation_request = self._continuation_request(request, content, finish_reason)
+            if continuation_request:
+                self.console.print("[yellow]⚠️ Generating the remaining exercises...[/yellow]")
+                
+                continuation, finish_reason = stream_completion(self.client, self.console, **continuation_request)
+                content = content + "\n" + continuation
+            
+            return content, finish_reason
+            
+        except Exception as e:
+            self.console.print(f"[red]Error generating practice exercises: {str(e)}[/red]")
+            return None, None
+    
+    def _generate_with_batch(self, request: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+        try:
+            results = run_chat_batch(
+                self.client,
+                {"practice": request},
+                self.console,
+                poll_interval=self.config.get("batch_poll_interval", 30)
+            )
+        except Exception as e:
+            self.console.print(f"[red]Error generating practice exercises: {str(e)}[/red]")
+            return None, None
+        
+        return results["practice"]
+    
+    def prepare_batch_request(self, config: PracticeConfig,
+                              use_cache: bool = True) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """Return ``(cached, None)`` on a cache hit, else ``(None, pending)`` for a batch job.
+
+        ``pending["body"]`` is the chat completion body for run_chat_batch; pass ``pending`` and the
+        batch result to store_batch_result.
+        """
+        request = self._build_request(config)
+        cache_key = self._cache_key(request)
+        
+        embedding = None
+        semantic_scope = self._semantic_scope(config)
+        
+        if use_cache:
+            cached, embedding = self._lookup_cached(config, cache_key, semantic_scope)
+            if cached:
+                return cached, None
+        
+        return None, {
+            "body": request,
+            "cache_key": cache_key,
+            "embedding": embedding,
+            "semantic_scope": semantic_scope
+        }
+    
+    def store_batch_result(self, pending: Dict[str, Any], content: str, finish_reason: Optional[str]):
+        """Cache a practice document produced for a request from prepare_batch_request, unless it was cut off."""
+        self._store_cached(content, finish_reason, pending["cache_key"], pending["embedding"], pending["semantic_scope"])
+    
+    async def agenerate_practice_exercises(self, config: PracticeConfig,
+                                           use_cache: bool = True) -> Optional[str]:
+        request = self._build_request(config)
+        cache_key = self._cache_key(request)
+        
+        embedding = None
+        semantic_scope = self._semantic_scope(config)
+        
+        if use_cache:
+            cached = self.cache.get(cache_key)
+            if cached:
+                self.console.print(f"[green]⚡ Loaded practice document for {config.topic} from cache[/green]")
+                return cached
+            
+            embedding = await aembed_text(self._aclient.get(), self._embedding_model, config.topic)
+            cached = self._similar_cached(embedding, semantic_scope)
+            if cached:
+                return cached
+        
+        try:
+            response = await acall_with_retries(
+                self._aclient.get().chat.completions.create,
+                self.console,
+                **request
+            )
+            
+            content = response.choices[0].message.content or ""
+            finish_reason = response.choices[0].finish_reason
+            
+            continuation_request = self._continuation_request(request, content, finish_reason)
+            if continuation_request:
+                self.console.print("[yellow]⚠️ Generating the remaining exercises...[/yellow]")
+                
+                response = await acall_with_retries(
+                    self._aclient.get().chat.completions.create,
+                    self.console,
+                    **continuation_request
+                )
+                content = content + "\n" + (response.choices[0].message.content or "")
+                finish_reason = response.choices[0].finish_reason
+            
+        except Exception as e:
+            self.console.print(f"[red]Error generating practice exercises: {str(e)}[/red]")
+            return None
+        
+        self._store_cached(content, finish_reason, cache_key, embedding, semantic_scope)
+        return content
+    
+    async def aclose(self):
+        """Close the async client; call before the event loop that used it shuts down."""
+        await self._aclient.aclose()
+    
+    def _build_request(self, config: PracticeConfig) -> Dict[str, Any]:
+        messages = self._practice_messages(self._create_practice_prompt(config))
+        # Size the output budget to the requested exercises instead of always asking for the maximum
+        max_tokens = min(self._max_tokens, TOKENS_PER_EXERCISE * config.exercise_count + BASE_DOCUMENT_TOKENS)
+        return {
+            "model": self._model,
+            "messages": messages,
+            "temperature": self._temp,
+            "max_tokens": budget_max_tokens(messages, self._model, max_tokens)
+        }
+    
+    def _is_complete(self, finish_reason: Optional[str]) -> bool:
+        # A document that is still cut off is returned but not cached, so the next run regenerates it
+        if finish_reason in TRUNCATED_FINISH_REASONS:
+            self.console.print("[yellow]⚠️ Practice document was cut off, not caching it[/yellow]")
+            return False
+        return True
+    
+    def _cache_key(self, request: Dict[str, Any]) -> str:
+        return ResponseCache.make_key(request)
+    
+    def _semantic_scope(self, config: PracticeConfig) -> str:
+        return SemanticCache.scope(
+            model=self._model,
+            embedding_model=self._embedding_model,
+            difficulty_level=config.difficulty_level,
+            exercise_count=config.exercise_count,
+            include_solutions=config.include_solutions,
+            exercise_types=config.exercise_types,
+            focus_areas=config.focus_areas
+        )
+    
+    def _similar_cached(self, embedding: Optional[list], semantic_scope: str) -> Optional[str]:
+        """Return a cached document for a near-identical topic, if one is similar enough."""
+        if embedding is None:
+            return None
+        
+        cached, score = self.semantic_cache.find_cached(embedding, semantic_scope, self.cache)
+        if cached and score >= self._semantic_threshold:
+            self.console.print(f"[green]⚡ Loaded practice document for a similar topic from cache (similarity {score:.2f})[/green]")
+            return cached
+        return None
+    
+    def _practice_messages(self, prompt: str) -> List[Dict[str, str]]:
+        return [
+            {
+                "role": "system",
+                "content": SYSTEM_PROMPT
+            },
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ]
+    
+    def _continuation_request(self, request: Dict[str, Any], content: str,
+                              finish_reason: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Build the follow-up request that extends a short or cut-off document, or None if it is complete."""
+        if len(content) >= MIN_CONTENT_CHARS and finish_reason not in TRUNCATED_FINISH_REASONS:
+            return None
+        
+        # The first request is sized to the exercise count; the follow-up may use the rest of max_tokens
+        remaining_tokens = self._max_tokens - count_tokens(content, request["model"])
+        if remaining_tokens <= 0:
+            return None
+        
+        # Same prefix as the first call, so OpenAI's prompt cache bills it at the cached rate
+        messages = request["messages"] + [
+            {
+                "role": "assistant",
+                "content": content
+            },
+            {
+                "role": "user",
+                "content": CONTINUE_PROMPT
+            }
+        ]
+        return {**request, "messages": messages, "max_tokens": budget_max_tokens(messages, request["model"], remaining_tokens)}
+    
+    def _create_practice_prompt(self, config: PracticeConfig) -> str:
+        exercise_types = config.exercise_types or [
+            "Basic Concepts", 
+            "Practical Applications", 
+            "Problem Solving", 
+            "Real-world Projects", 
+            "Code Debugging", 
+            "Performance Optimization",
+            "Best Practices",
+            "Integration Challenges"
+        ]
+        
+        base_prompt = f"""
+Create an EXTREMELY COMPREHENSIVE and PRACTICAL exercise document for {config.topic} targeted at {config.difficulty_level} level learners.
+
+CRITICAL REQUIREMENTS:
+- Write EVERYTHING in ENGLISH language only
+- This must be a COMPLETE, HANDS-ON learning resource
+- Format: Rich, well-structured Markdown with extensive practical content
+- Difficulty Level: {config.difficulty_level} - but include progressive difficulty
+- Include solutions: {config.include_solutions} - provide DETAILED solutions with explanations
+- Number of exercises: {config.exercise_count}+ exercises across different categories
+- Use proper Markdown syntax with headers, code blocks, tables, and lists
+- Add emojis for visual appeal and better organization
+- Include a detailed table of contents with clickable links
+- Organize exercises by category and difficulty
+- Include real-world scenarios and industry-standard problems
+- Provide multiple solution approaches where applicable
+- Include code reviews and best practice explanations
 """
         
-        return base_prompt + structure_guide
+        if config.focus_areas:
+            base_prompt += f"Focus extensively on these areas: {', '.join(config.focus_areas)}\n"
+        
+        return base_prompt + _STRUCTURE_GUIDE_TMPL.substitute(
+            topic=config.topic,
+            exercise_count=config.exercise_count,
+            exercise_count_q=config.exercise_count // 4,
+            exercise_count_t=config.exercise_count // 3,
+            types=", ".join(exercise_types)
+        )
     
     def save_practice_document(self, content: str, topic: str, difficulty: str) -> str:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{topic.lower().replace(' ', '_')}_practice_{difficulty}_{timestamp}.md"
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        filename = f"{slugify(topic)}_practice_{difficulty}_{timestamp}.md"
         filepath = self.practice_dir / filename
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
+            # Encode once and write the bytes as-is, so newlines are never translated to \r\n
+            data = content.encode("utf-8")
+            if filepath.exists() and filepath.read_bytes() == data:
+                return str(filepath)
+            
+            filepath.write_bytes(data)
             return str(filepath)
         except Exception as e:
             self.console.print(f"[red]Error saving practice document: {str(e)}[/red]")
             return None
     
     def preview_practice_document(self, content: str):
-        # Show only first 2000 characters for preview
-        preview_content = content[:2000] + "\n\n... [Document continues with full exercises and solutions]"
-        md = Markdown(preview_content)
-        panel = Panel(md, title="🎯 Practice Document Preview", border_style="green")
+        # Show only first PREVIEW_CHARS characters for preview
+        if len(content) <= PREVIEW_CHARS:
+            body = Markdown(content)
+        else:
+            # The suffix is plain text, so only the document excerpt goes through the Markdown parser
+            body = Group(Markdown(content[:PREVIEW_CHARS]), Text(_PREVIEW_SUFFIX))
+        panel = Panel(body, title="🎯 Practice Document Preview", border_style="green")
         self.console.print(panel)
     
     def create_practice_document(self, topic: str, difficulty: str = "intermediate",
                                 exercise_count: int = 20, include_solutions: bool = True,
                                 focus_areas: Optional[List[str]] = None,
                                 exercise_types: Optional[List[str]] = None,
-                                preview: bool = False) -> Optional[str]:
+                                preview: bool = False, use_batch: bool = False,
+                                use_cache: bool = True) -> Optional[str]:
         
         config = PracticeConfig(
             topic=topic,
@@ -353,7 +564,7 @@ TARGET: 10,000+ words for truly comprehensive practical learning.
         self.console.print(f"[yellow]🎯 Generating practice exercises for: {topic}[/yellow]")
         self.console.print(f"[dim]Difficulty: {difficulty} | Exercises: {exercise_count}[/dim]")
         
-        content = self.generate_practice_exercises(config)
+        content = self.generate_practice_exercises(config, use_batch=use_batch, use_cache=use_cache)
         
         if not content:
             return None
@@ -369,6 +580,42 @@ TARGET: 10,000+ words for truly comprehensive practical learning.
         
         return None
     
+    async def acreate_practice_document(self, topic: str, difficulty: str = "intermediate",
+                                        exercise_count: int = 20, include_solutions: bool = True,
+                                        focus_areas: Optional[List[str]] = None,
+                                        exercise_types: Optional[List[str]] = None,
+                                        preview: bool = False, use_cache: bool = True) -> Optional[str]:
+        """Async counterpart of create_practice_document, for running alongside other generations."""
+        
+        config = PracticeConfig(
+            topic=topic,
+            difficulty_level=difficulty,
+            exercise_count=exercise_count,
+            include_solutions=include_solutions,
+            focus_areas=focus_areas,
+            exercise_types=exercise_types
+        )
+        
+        self.console.print(f"[yellow]🎯 Generating practice exercises for: {topic}[/yellow]")
+        self.console.print(f"[dim]Difficulty: {difficulty} | Exercises: {exercise_count}[/dim]")
+        
+        content = await self.agenerate_practice_exercises(config, use_cache=use_cache)
+        
+        if not content:
+            return None
+        
+        if preview:
+            self.preview_practice_document(content)
+        
+        loop = asyncio.get_running_loop()
+        filepath = await loop.run_in_executor(None, self.save_practice_document, content, topic, difficulty)
+        
+        if filepath:
+            self.console.print(f"[green]✅ Practice document saved to: {filepath}[/green]")
+            return filepath
+        
+        return None
+    
     def interactive_practice_creation(self):
         """Interactive mode for creating practice documents"""
         
@@ -414,4 +661,9 @@ TARGET: 10,000+ words for truly comprehensive practical learning.
             include_solutions=include_solutions,
             focus_areas=focus_areas,
             preview=preview
-        )
\ No newline at end of file
+        )
+
+@lru_cache(maxsize=1)
+def get_practice_generator() -> PracticeGenerator:
+    """Return the generator shared by every command in this process."""
+    return PracticeGenerator()
\ No newline at end of file
@@ -0,0 +1,71 @@
+from functools import lru_cache
+from typing import List, Dict, Optional
+
+import tiktoken
+
+# Extra tokens the chat format adds around each message and the reply primer
+TOKENS_PER_MESSAGE = 4
+TOKENS_PER_REPLY = 3
+# Safety margin left unused in the context window
+CONTEXT_MARGIN = 64
+# Rough size of a token in English text, used when no encoding is available
+CHARS_PER_TOKEN = 4
+
+CONTEXT_WINDOW = {
+    "gpt-4o": 128000,
+    "gpt-4o-mini": 128000,
+    "gpt-4-turbo": 128000,
+    "gpt-4.1": 1047576,
+    "gpt-4-32k": 32768,
+    "gpt-4": 8192,
+    "gpt-3.5-turbo": 16385,
+}
+
+
+@lru_cache(maxsize=None)
+def get_encoding(model: str) -> Optional[tiktoken.Encoding]:
+    """Return the model's encoding, or None if it cannot be loaded.
+
+    tiktoken downloads the BPE file on first use, so this fails offline; the result is cached
+    either way so the download is attempted only once per process.
+    """
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        return None
+
+
+def count_tokens(text: str, model: str) -> int:
+    encoding = get_encoding(model)
+    if encoding is None:
+        return len(text) // CHARS_PER_TOKEN
+    return len(encoding.encode(text))
+
+
+def count_message_tokens(messages: List[Dict[str, str]], model: str) -> int:
+    total = TOKENS_PER_REPLY
+    for message in messages:
+        total += TOKENS_PER_MESSAGE + count_tokens(message["content"], model)
+    return total
+
+
+def get_context_window(model: str) -> Optional[int]:
+    if model in CONTEXT_WINDOW:
+        return CONTEXT_WINDOW[model]
+    # Dated snapshots such as gpt-4o-2024-08-06 share their base model's window
+    prefixes = [name for name in CONTEXT_WINDOW if model.startswith(name + "-")]
+    if prefixes:
+        return CONTEXT_WINDOW[max(prefixes, key=len)]
+    return None
+
+
+def budget_max_tokens(messages: List[Dict[str, str]], model: str, configured: int) -> int:
+    """Clamp the configured max_tokens to what still fits in the model's context window."""
+    context_window = get_context_window(model)
+    if context_window is None or get_encoding(model) is None:
+        return configured
+    available = context_window - count_message_tokens(messages, model) - CONTEXT_MARGIN
+    return max(1, min(configured, available))